@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 from datetime import date, datetime
@@ -73,6 +74,7 @@ class OrtexClient:
         max_retries: int = MAX_RETRIES,
         max_concurrent_requests: int | None = None,
         requests_per_second: float | None = None,
+        session: requests.Session | None = None,
     ) -> None:
         """Initialize the ORTEX API client.
 
@@ -88,6 +90,10 @@ class OrtexClient:
             requests_per_second: Maximum requests per second (rate limit).
                 Defaults to None (no rate limit). When set, requests are
                 spaced to maintain this rate across all threads.
+            session: Optional ``requests.Session`` to send requests through,
+                e.g. to share connection pools between clients. Its headers
+                are left untouched and it is not closed by ``close()``.
+                Defaults to a new session owned by this client.
 
         Raises:
             AuthenticationError: If no API key is provided or found in environment.
@@ -135,15 +141,19 @@ class OrtexClient:
             requests_per_second=effective_requests_per_second,
         )
 
-        self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "Ortex-Api-Key": self.api_key,
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-                "User-Agent": "ortex-python-sdk/1.0.4",
-            }
-        )
+        self._headers = {
+            "Ortex-Api-Key": self.api_key,
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "User-Agent": "ortex-python-sdk/1.0.4",
+        }
+
+        # A caller-provided session may be shared, so headers are sent per
+        # request instead of being written onto it
+        self._owns_session = session is None
+        self._session = session if session is not None else requests.Session()
+        if self._owns_session:
+            self._session.headers.update(self._headers)
 
     def _build_url(self, endpoint: str) -> str:
         """Build full URL from endpoint.
@@ -266,6 +276,7 @@ class OrtexClient:
                     response = self._session.get(
                         self._build_url(endpoint),
                         params=params,
+                        headers=self._headers,
                         timeout=self.timeout,
                     )
                     return self._handle_response(response)
@@ -322,9 +333,11 @@ class OrtexClient:
         """Close the HTTP session.
 
         Call this method when you're done using the client to release resources.
-        Alternatively, use the client as a context manager.
+        Alternatively, use the client as a context manager. A session passed to
+        the constructor is left open for its owner to close.
         """
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
     def __enter__(self) -> OrtexClient:
         """Enter context manager."""
@@ -367,6 +380,25 @@ def normalize_ticker(ticker: str) -> str:
     return ticker.upper().strip()
 
 
+@functools.lru_cache(maxsize=1024)
+def _validate_date_string(d: str) -> str:
+    """Check that a date string is in YYYY-MM-DD format.
+
+    Results are cached since the same dates are typically passed repeatedly.
+
+    Args:
+        d: Stripped date string.
+
+    Returns:
+        The date string unchanged.
+
+    Raises:
+        ValueError: If the string is not a valid YYYY-MM-DD date.
+    """
+    datetime.strptime(d, "%Y-%m-%d")
+    return d
+
+
 def normalize_date(d: str | date | datetime | None) -> str | None:
     """Normalize date to YYYY-MM-DD string format.
 
@@ -399,8 +431,7 @@ def normalize_date(d: str | date | datetime | None) -> str | None:
     if isinstance(d, str):
         # Validate format
         try:
-            datetime.strptime(d.strip(), "%Y-%m-%d")
-            return d.strip()
+            return _validate_date_string(d.strip())
         except ValueError as e:
             raise ValidationError(f"Invalid date format: '{d}'. Expected YYYY-MM-DD format.") from e
 
@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import threading
 import time
-from collections.abc import Generator
-from contextlib import contextmanager
+from collections.abc import Callable, Generator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 
 
 class RequestThrottler:
@@ -22,6 +22,9 @@ class RequestThrottler:
         ...     response = session.get(url)
     """
 
+    # Reusable context manager handed out when throttling is fully disabled
+    _NOOP_CM: AbstractContextManager[None] = nullcontext()
+
     def __init__(
         self,
         max_concurrent: int = 10,
@@ -39,6 +42,10 @@ class RequestThrottler:
         self._max_concurrent = max_concurrent
         self._requests_per_second = requests_per_second
 
+        # Clock and sleep used for rate limiting; replaceable in tests
+        self._time: Callable[[], float] = time.monotonic
+        self._sleep: Callable[[float], None] = time.sleep
+
         # Semaphore for limiting concurrent requests
         if max_concurrent > 0:
             self._semaphore: threading.Semaphore | None = threading.Semaphore(max_concurrent)
@@ -49,7 +56,7 @@ class RequestThrottler:
         self._rate_lock = threading.Lock()
         self._tokens = float(max_concurrent) if max_concurrent > 0 else 1.0
         self._max_tokens = self._tokens
-        self._last_refill = time.monotonic()
+        self._last_refill = self._time()
 
         # Statistics
         self._stats_lock = threading.Lock()
@@ -86,7 +93,7 @@ class RequestThrottler:
         if self._requests_per_second is None:
             return
 
-        now = time.monotonic()
+        now = self._time()
         elapsed = now - self._last_refill
         self._last_refill = now
 
@@ -112,26 +119,28 @@ class RequestThrottler:
 
         # Wait outside the lock
         if wait_time > 0:
-            time.sleep(wait_time)
+            self._sleep(wait_time)
 
         # Consume the token after waiting
         with self._rate_lock:
             self._refill_tokens()
             self._tokens = max(0, self._tokens - 1.0)
 
-    @contextmanager
-    def acquire(self, timeout: float | None = None) -> Generator[None, None, None]:
+    def acquire(self, timeout: float | None = None) -> AbstractContextManager[None]:
         """Acquire permission to make a request.
 
         This context manager blocks until the request is allowed based on
-        both concurrency limits and rate limits.
+        both concurrency limits and rate limits. When both are disabled
+        (``max_concurrent <= 0`` and no ``requests_per_second``), a shared
+        no-op context manager is returned and no statistics are recorded.
 
         Args:
-            timeout: Maximum seconds to wait for permission. None means wait forever.
+            timeout: Maximum seconds to wait for permission. None means wait forever,
+                     0 means don't wait (fail at once if no slot is free).
                      Only applies to the concurrency semaphore, not rate limiting.
 
-        Yields:
-            None when permission is granted.
+        Returns:
+            Context manager that holds the permission while its block runs.
 
         Raises:
             TimeoutError: If timeout is specified and permission is not granted in time.
@@ -140,6 +149,13 @@ class RequestThrottler:
             >>> with throttler.acquire():
             ...     response = session.get(url)
         """
+        if self._semaphore is None and self._requests_per_second is None:
+            return self._NOOP_CM
+        return self._acquire(timeout)
+
+    @contextmanager
+    def _acquire(self, timeout: float | None) -> Generator[None, None, None]:
+        """Acquire a concurrency slot and rate limit token, tracking statistics."""
         # Track queued request
         with self._stats_lock:
             self._queued_requests += 1
@@ -2,31 +2,170 @@
 
 from __future__ import annotations
 
-import os
-from collections.abc import Generator
-from unittest.mock import patch
+from collections.abc import Callable, Generator
+from types import ModuleType
+from typing import Any
 
 import pytest
+import requests
+import responses
+from requests.adapters import BaseAdapter
 
+import ortex
+import ortex.api as _ortex_api
+from ortex import OrtexClient
+from ortex.throttler import RequestThrottler
 
-@pytest.fixture
+from .payloads import make_paginated_response
+
+
+class CannedAdapter(BaseAdapter):
+    """Transport adapter serving canned responses looked up by URL.
+
+    Routes map a URL without its query string to a ``(body, status)`` pair,
+    so matching a request is a single dict lookup.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the adapter with no routes."""
+        super().__init__()
+        self.routes: dict[str, tuple[bytes, int]] = {}
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        """Return the canned response registered for the request URL."""
+        url = (request.url or "").split("?", 1)[0]
+        try:
+            body, status = self.routes[url]
+        except KeyError:
+            raise requests.ConnectionError(
+                f"No canned response for {url}", request=request
+            ) from None
+
+        response = requests.Response()
+        response.status_code = status
+        response._content = body
+        response.headers["Content-Type"] = "application/json"
+        response.encoding = "utf-8"
+        response.url = request.url or url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        """Nothing to release; there are no pooled connections."""
+
+
+@pytest.fixture(scope="session")
 def api_key() -> str:
     """Provide a test API key."""
     return "test-api-key-12345"
 
 
-@pytest.fixture(autouse=True)
-def reset_global_client() -> Generator[None, None, None]:
-    """Reset global client state between tests."""
-    import ortex.api
+@pytest.fixture(scope="session")
+def pd_mod() -> ModuleType:
+    """Provide the pandas module, imported on first use."""
+    import pandas
+
+    return pandas
+
+
+@pytest.fixture(scope="session")
+def canned_adapter() -> CannedAdapter:
+    """Provide the canned response adapter mounted on the global client."""
+    return CannedAdapter()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def session_client(api_key: str, canned_adapter: CannedAdapter) -> OrtexClient:
+    """Install one global client shared by the whole test session.
+
+    Its throttler is disabled so tests sharing it are never rate limited, and
+    its session serves API requests from ``canned_adapter``.
+    """
+    ortex.set_api_key(api_key)
+    client = ortex.get_client()
+    client._throttler = RequestThrottler(max_concurrent=0)
+    client._session.mount(OrtexClient.BASE_URL, canned_adapter)
+    return client
+
 
-    original_client = ortex.api._client
+@pytest.fixture(scope="session")
+def _shared_session() -> Generator[requests.Session, None, None]:
+    """Provide one HTTP session reused by every shared test client."""
+    session = requests.Session()
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def shared_client(api_key: str, _shared_session: requests.Session) -> OrtexClient:
+    """Provide an unthrottled client shared by tests that only issue requests.
+
+    Tests needing other settings should ``monkeypatch.setattr`` the attribute
+    on this client, or build their own instance. Its throttler is replaced by
+    a disabled one, so it is not suitable for checking throttler settings.
+    """
+    client = OrtexClient(api_key=api_key, session=_shared_session)
+    client._throttler = RequestThrottler(max_concurrent=0)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def reset_global_client(session_client: OrtexClient) -> Generator[None, None, None]:
+    """Restore the shared global client after each test."""
     yield
-    ortex.api._client = original_client
+    _ortex_api._client = session_client
+
+
+@pytest.fixture(scope="module")
+def responses_mock() -> Generator[responses.RequestsMock, None, None]:
+    """Patch the HTTP transport with the default ``responses`` mock per module."""
+    responses.mock.start()
+    yield responses.mock
+    responses.mock.stop(allow_assert=False)
+
+
+@pytest.fixture(autouse=True)
+def mocked_responses(
+    responses_mock: responses.RequestsMock,
+) -> Generator[responses.RequestsMock, None, None]:
+    """Intercept HTTP requests made by every test.
+
+    This uses the default ``responses`` mock, so module-level
+    ``responses.add`` calls work without an ``@responses.activate`` decorator.
+    Registered stubs are reset after each test and unused stubs are not
+    reported as failures.
+    """
+    yield responses_mock
+    responses_mock.reset()
 
 
 @pytest.fixture
-def mock_env_api_key(api_key: str) -> Generator[None, None, None]:
+def mock_env_api_key(api_key: str, monkeypatch: pytest.MonkeyPatch) -> None:
     """Set API key in environment."""
-    with patch.dict(os.environ, {"ORTEX_API_KEY": api_key}):
-        yield
+    monkeypatch.setenv("ORTEX_API_KEY", api_key)
+
+
+@pytest.fixture
+def mock_get(canned_adapter: CannedAdapter) -> Generator[Callable[..., None], None, None]:
+    """Provide a helper registering GET responses for the global client.
+
+    The returned callable takes the URL and the rows to serve as a standard
+    paginated response; ``body=...`` serves a prebuilt response body instead.
+    Routes are cleared when the test finishes.
+    """
+
+    def _register(
+        url: str,
+        rows: list[dict[str, Any]] | None = None,
+        *,
+        body: bytes | None = None,
+        status: int = 200,
+    ) -> None:
+        if body is None:
+            body = make_paginated_response(rows or [])
+        canned_adapter.routes[url] = (body, status)
+
+    yield _register
+    canned_adapter.routes.clear()
@@ -0,0 +1,46 @@
+"""API response payload builders shared by the ORTEX SDK tests."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+def make_paginated_response(
+    rows: list[dict[str, Any]],
+    credits_used: float = 1.0,
+    credits_left: float = 1000.0,
+    next_page: str | None = None,
+    length: int | None = None,
+) -> bytes:
+    """Create a standard paginated API response body."""
+    return json.dumps(
+        {
+            "paginationLinks": {"next": next_page, "previous": None},
+            "length": len(rows) if length is None else length,
+            "rows": rows,
+            "creditsUsed": credits_used,
+            "creditsLeft": credits_left,
+        }
+    ).encode()
+
+
+def make_fundamentals_response(
+    data: dict[str, Any],
+    company: str = "Test Company",
+    period: str = "2024Q3",
+    category: str = "income",
+    credits_used: float = 0.1,
+    credits_left: float = 1000.0,
+) -> bytes:
+    """Create a fundamentals API response body."""
+    return json.dumps(
+        {
+            "company": company,
+            "period": period,
+            "category": category,
+            "data": data,
+            "creditsUsed": credits_used,
+            "creditsLeft": credits_left,
+        }
+    ).encode()
@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 from datetime import date, datetime
+from typing import Any
 from unittest.mock import patch
 
 import pytest
+import requests
 import responses
-from responses import matchers
 
 from ortex import OrtexClient
 from ortex.client import normalize_date, normalize_exchange, normalize_ticker, to_dataframe
 from ortex.exceptions import (
+    APIError,
     AuthenticationError,
     NotFoundError,
     RateLimitError,
@@ -19,6 +21,25 @@ from ortex.exceptions import (
     ValidationError,
 )
 
+URL = "https://api.ortex.com/api/v1/test/endpoint"
+
+
+def _stub(
+    status: int = 200,
+    *,
+    json: Any = None,
+    headers: dict[str, str] | None = None,
+    query: str = "",
+) -> None:
+    """Register a GET response for the test endpoint."""
+    responses.add(
+        responses.GET,
+        f"{URL}?{query}" if query else URL,
+        json=json if json is not None else {"error": "Request failed"},
+        status=status,
+        headers=headers or {},
+    )
+
 
 class TestOrtexClientInit:
     """Tests for OrtexClient initialization."""
@@ -28,17 +49,17 @@ class TestOrtexClientInit:
         client = OrtexClient(api_key=api_key)
         assert client.api_key == api_key
 
-    def test_init_with_env_var(self, api_key: str) -> None:
+    def test_init_with_env_var(self, api_key: str, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test client initialization with environment variable."""
-        with patch.dict("os.environ", {"ORTEX_API_KEY": api_key}):
-            client = OrtexClient()
-            assert client.api_key == api_key
+        monkeypatch.setenv("ORTEX_API_KEY", api_key)
+        client = OrtexClient()
+        assert client.api_key == api_key
 
-    def test_init_without_api_key_raises(self) -> None:
+    def test_init_without_api_key_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that initialization without API key raises AuthenticationError."""
-        with patch.dict("os.environ", {}, clear=True):
-            with pytest.raises(AuthenticationError):
-                OrtexClient()
+        monkeypatch.delenv("ORTEX_API_KEY", raising=False)
+        with pytest.raises(AuthenticationError):
+            OrtexClient()
 
     def test_init_sets_headers(self, api_key: str) -> None:
         """Test that initialization sets correct headers."""
@@ -47,6 +68,13 @@ class TestOrtexClientInit:
         assert client._session.headers["Content-Type"] == "application/json"
         assert client._session.headers["Accept"] == "application/json"
 
+    def test_init_with_session_leaves_headers(self, api_key: str) -> None:
+        """Test that a provided session is used without changing its headers."""
+        session = requests.Session()
+        client = OrtexClient(api_key=api_key, session=session)
+        assert client._session is session
+        assert "Ortex-Api-Key" not in session.headers
+
     def test_init_custom_timeout(self, api_key: str) -> None:
         """Test client initialization with custom timeout."""
         client = OrtexClient(api_key=api_key, timeout=60)
@@ -61,110 +89,69 @@ class TestOrtexClientInit:
 class TestOrtexClientGet:
     """Tests for OrtexClient.get method."""
 
-    @responses.activate
-    def test_get_success(self, api_key: str) -> None:
+    def test_get_success(self, shared_client: OrtexClient) -> None:
         """Test successful GET request."""
         data = {"value": 123}
-        responses.add(
-            responses.GET,
-            "https://api.ortex.com/api/v1/test/endpoint",
-            json=data,
-            status=200,
-        )
+        _stub(json=data)
+
+        result = shared_client.get("test/endpoint")
+
+        assert result == data
 
+    def test_get_through_default_throttler(self, api_key: str) -> None:
+        """Test that GET requests go through the client's default throttler."""
         client = OrtexClient(api_key=api_key)
+        _stub(json={"value": 123})
+
         result = client.get("test/endpoint")
 
-        assert result == data
+        assert result == {"value": 123}
+        assert client.throttler.stats["total_requests"] == 1
+        assert client.throttler.stats["current_concurrent"] == 0
 
-    @responses.activate
-    def test_get_with_params(self, api_key: str) -> None:
-        """Test GET request with query parameters."""
-        data = {"value": 123}
-        responses.add(
-            responses.GET,
-            "https://api.ortex.com/api/v1/test/endpoint",
-            json=data,
-            status=200,
-            match=[matchers.query_param_matcher({"from_date": "2024-01-01"})],
-        )
+    def test_get_sends_headers_per_request(self, shared_client: OrtexClient, api_key: str) -> None:
+        """Test that API headers are sent on a caller-provided session."""
+        _stub(json={})
 
-        client = OrtexClient(api_key=api_key)
-        result = client.get("test/endpoint", params={"from_date": "2024-01-01"})
+        shared_client.get("test/endpoint")
 
-        assert result == data
+        assert responses.calls[0].request.headers["Ortex-Api-Key"] == api_key
 
-    @responses.activate
-    def test_get_401_raises_authentication_error(self, api_key: str) -> None:
-        """Test that 401 response raises AuthenticationError."""
-        responses.add(
-            responses.GET,
-            "https://api.ortex.com/api/v1/test/endpoint",
-            json={"error": "Invalid API key"},
-            status=401,
-        )
+    def test_get_with_params(self, shared_client: OrtexClient) -> None:
+        """Test GET request with query parameters."""
+        data = {"value": 123}
+        _stub(json=data, query="from_date=2024-01-01")
 
-        client = OrtexClient(api_key=api_key)
-        with pytest.raises(AuthenticationError):
-            client.get("test/endpoint")
-
-    @responses.activate
-    def test_get_404_raises_not_found_error(self, api_key: str) -> None:
-        """Test that 404 response raises NotFoundError."""
-        responses.add(
-            responses.GET,
-            "https://api.ortex.com/api/v1/test/endpoint",
-            json={"error": "Not found"},
-            status=404,
-        )
+        result = shared_client.get("test/endpoint", params={"from_date": "2024-01-01"})
 
-        client = OrtexClient(api_key=api_key)
-        with pytest.raises(NotFoundError):
-            client.get("test/endpoint")
-
-    @responses.activate
-    def test_get_400_raises_validation_error(self, api_key: str) -> None:
-        """Test that 400 response raises ValidationError."""
-        responses.add(
-            responses.GET,
-            "https://api.ortex.com/api/v1/test/endpoint",
-            json={"error": "Invalid parameters"},
-            status=400,
-        )
+        assert result == data
 
-        client = OrtexClient(api_key=api_key)
-        with pytest.raises(ValidationError):
-            client.get("test/endpoint")
-
-    @responses.activate
-    def test_get_429_raises_rate_limit_error(self, api_key: str) -> None:
-        """Test that 429 response raises RateLimitError."""
-        responses.add(
-            responses.GET,
-            "https://api.ortex.com/api/v1/test/endpoint",
-            json={"error": "Rate limit exceeded"},
-            status=429,
-            headers={"Retry-After": "60"},
-        )
-
-        client = OrtexClient(api_key=api_key, max_retries=1)
-        with pytest.raises(RateLimitError) as exc_info:
-            client.get("test/endpoint")
-        assert exc_info.value.retry_after == 60
-
-    @responses.activate
-    def test_get_500_raises_server_error(self, api_key: str) -> None:
-        """Test that 500 response raises ServerError."""
-        responses.add(
-            responses.GET,
-            "https://api.ortex.com/api/v1/test/endpoint",
-            json={"error": "Internal server error"},
-            status=500,
-        )
-
-        client = OrtexClient(api_key=api_key, max_retries=1)
-        with pytest.raises(ServerError):
-            client.get("test/endpoint")
+    @pytest.mark.parametrize(
+        "status,exc,headers",
+        [
+            (401, AuthenticationError, {}),
+            (404, NotFoundError, {}),
+            (400, ValidationError, {}),
+            (429, RateLimitError, {"Retry-After": "60"}),
+            (500, ServerError, {}),
+        ],
+    )
+    def test_get_error_status_raises(
+        self,
+        shared_client: OrtexClient,
+        monkeypatch: pytest.MonkeyPatch,
+        status: int,
+        exc: type[APIError],
+        headers: dict[str, str],
+    ) -> None:
+        """Test that error responses raise the matching exception."""
+        _stub(status, headers=headers)
+
+        monkeypatch.setattr(shared_client, "max_retries", 1)
+        with pytest.raises(exc) as exc_info:
+            shared_client.get("test/endpoint")
+        if isinstance(exc_info.value, RateLimitError):
+            assert exc_info.value.retry_after == 60
 
 
 class TestOrtexClientContextManager:
@@ -175,66 +162,74 @@ class TestOrtexClientContextManager:
         with OrtexClient(api_key=api_key) as client:
             assert client.api_key == api_key
 
+    def test_close_leaves_provided_session_open(self, api_key: str) -> None:
+        """Test that closing the client does not close a caller-provided session."""
+        session = requests.Session()
+        with patch.object(session, "close") as close:
+            with OrtexClient(api_key=api_key, session=session):
+                pass
+
+        close.assert_not_called()
+
 
 class TestNormalizeFunctions:
     """Tests for normalization helper functions."""
 
-    def test_normalize_exchange_uppercase(self) -> None:
+    @pytest.mark.parametrize(
+        "value,expected", [("nyse", "NYSE"), ("NASDAQ", "NASDAQ"), ("  xetr  ", "XETR")]
+    )
+    def test_normalize_exchange(self, value: str, expected: str) -> None:
         """Test exchange normalization to uppercase."""
-        assert normalize_exchange("nyse") == "NYSE"
-        assert normalize_exchange("NASDAQ") == "NASDAQ"
-        assert normalize_exchange("  xetr  ") == "XETR"
+        assert normalize_exchange(value) == expected
 
-    def test_normalize_ticker_uppercase(self) -> None:
+    @pytest.mark.parametrize(
+        "value,expected", [("aapl", "AAPL"), ("TSLA", "TSLA"), ("  amc  ", "AMC")]
+    )
+    def test_normalize_ticker(self, value: str, expected: str) -> None:
         """Test ticker normalization to uppercase."""
-        assert normalize_ticker("aapl") == "AAPL"
-        assert normalize_ticker("TSLA") == "TSLA"
-        assert normalize_ticker("  amc  ") == "AMC"
-
-    def test_normalize_date_string(self) -> None:
-        """Test date normalization from string."""
-        assert normalize_date("2024-01-15") == "2024-01-15"
-        assert normalize_date("  2024-01-15  ") == "2024-01-15"
-
-    def test_normalize_date_date_object(self) -> None:
-        """Test date normalization from date object."""
-        assert normalize_date(date(2024, 1, 15)) == "2024-01-15"
-
-    def test_normalize_date_datetime_object(self) -> None:
-        """Test date normalization from datetime object."""
-        assert normalize_date(datetime(2024, 1, 15, 12, 30)) == "2024-01-15"
-
-    def test_normalize_date_none(self) -> None:
-        """Test date normalization returns None for None input."""
-        assert normalize_date(None) is None
-
-    def test_normalize_date_invalid_format_raises(self) -> None:
+        assert normalize_ticker(value) == expected
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("2024-01-15", "2024-01-15"),
+            ("  2024-01-15  ", "2024-01-15"),
+            (date(2024, 1, 15), "2024-01-15"),
+            (datetime(2024, 1, 15, 12, 30), "2024-01-15"),
+            (None, None),
+        ],
+    )
+    def test_normalize_date(self, value: str | date | None, expected: str | None) -> None:
+        """Test date normalization from strings, date and datetime objects, and None."""
+        assert normalize_date(value) == expected
+
+    @pytest.mark.parametrize("value", ["01-15-2024", "2024/01/15"])
+    def test_normalize_date_invalid_format_raises(self, value: str) -> None:
         """Test that invalid date format raises ValidationError."""
         with pytest.raises(ValidationError):
-            normalize_date("01-15-2024")
-
-        with pytest.raises(ValidationError):
-            normalize_date("2024/01/15")
+            normalize_date(value)
 
 
 class TestToDataframe:
     """Tests for to_dataframe function."""
 
-    def test_to_dataframe_list(self) -> None:
-        """Test converting list of dicts to DataFrame."""
-        data = [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
-        df = to_dataframe(data)
-        assert len(df) == 2
-        assert list(df.columns) == ["a", "b"]
-
-    def test_to_dataframe_dict(self) -> None:
-        """Test converting single dict to DataFrame."""
-        data = {"a": 1, "b": 2}
+    @pytest.mark.parametrize(
+        "data,expected_rows,expected_cols",
+        [
+            ([{"a": 1, "b": 2}, {"a": 3, "b": 4}], 2, ["a", "b"]),
+            ({"a": 1, "b": 2}, 1, ["a", "b"]),
+            ([], 0, []),
+        ],
+        ids=["list", "dict", "empty_list"],
+    )
+    def test_to_dataframe(
+        self,
+        data: list[dict[str, int]] | dict[str, int],
+        expected_rows: int,
+        expected_cols: list[str],
+    ) -> None:
+        """Test converting records or a single record to a DataFrame."""
         df = to_dataframe(data)
-        assert len(df) == 1
-        assert df.iloc[0]["a"] == 1
-
-    def test_to_dataframe_empty_list(self) -> None:
-        """Test empty list returns empty DataFrame."""
-        df = to_dataframe([])
-        assert len(df) == 0
+        assert df.shape[0] == expected_rows
+        assert df.columns.tolist() == expected_cols
+        assert df.to_dict("records") == (data if isinstance(data, list) else [data])
@@ -131,45 +131,33 @@ class TestNetworkError:
         assert error.status_code is None
 
 
+@pytest.fixture(scope="module")
+def exc_instances() -> tuple[APIError, ...]:
+    """Provide one default instance of every APIError subclass."""
+    return (
+        AuthenticationError(),
+        RateLimitError(),
+        NotFoundError(),
+        ValidationError(),
+        ServerError(),
+        TimeoutError(),
+        NetworkError(),
+    )
+
+
 class TestExceptionHierarchy:
     """Tests for exception inheritance hierarchy."""
 
-    def test_all_inherit_from_api_error(self) -> None:
+    def test_all_inherit_from_api_error(self, exc_instances: tuple[APIError, ...]) -> None:
         """Test all exceptions inherit from APIError."""
-        exceptions = [
-            AuthenticationError(),
-            RateLimitError(),
-            NotFoundError(),
-            ValidationError(),
-            ServerError(),
-            TimeoutError(),
-            NetworkError(),
-        ]
-        for exc in exceptions:
-            assert isinstance(exc, APIError)
-
-    def test_all_inherit_from_exception(self) -> None:
-        """Test all exceptions inherit from Exception."""
-        exceptions = [
-            APIError("test"),
-            AuthenticationError(),
-            RateLimitError(),
-            NotFoundError(),
-            ValidationError(),
-            ServerError(),
-            TimeoutError(),
-            NetworkError(),
-        ]
-        for exc in exceptions:
-            assert isinstance(exc, Exception)
-
-    def test_can_catch_as_api_error(self) -> None:
-        """Test all exceptions can be caught as APIError."""
-        with pytest.raises(APIError):
-            raise AuthenticationError()
+        assert all(isinstance(exc, APIError) for exc in exc_instances)
 
-        with pytest.raises(APIError):
-            raise RateLimitError()
+    def test_all_inherit_from_exception(self, exc_instances: tuple[APIError, ...]) -> None:
+        """Test all exceptions inherit from Exception."""
+        assert all(isinstance(exc, Exception) for exc in (APIError("test"), *exc_instances))
 
-        with pytest.raises(APIError):
-            raise NotFoundError()
+    def test_can_catch_as_api_error(self, exc_instances: tuple[APIError, ...]) -> None:
+        """Test all exceptions can be caught as APIError."""
+        for exc in exc_instances:
+            with pytest.raises(APIError):
+                raise exc
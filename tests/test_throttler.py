@@ -4,10 +4,42 @@ from __future__ import annotations
 
 import threading
 import time
+from collections.abc import Generator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import pytest
+
+from ortex import OrtexClient
 from ortex.throttler import RequestThrottler
 
+# Keep these tests on one xdist worker so they share the module-scoped pool
+pytestmark = pytest.mark.xdist_group("throttler")
+
+
+class FakeClock:
+    """Monotonic clock that only advances when slept on."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        """Initialize the clock at the given time."""
+        self.now = start
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Record the sleep and advance the clock instead of blocking."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(scope="module")
+def pool() -> Generator[ThreadPoolExecutor, None, None]:
+    """Provide a thread pool shared by the concurrency tests in this module."""
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        yield executor
+
 
 class TestRequestThrottlerInit:
     """Tests for RequestThrottler initialization."""
@@ -68,34 +100,55 @@ class TestRequestThrottlerAcquire:
         stats = throttler.stats
         assert stats["total_requests"] == 5
 
+    def test_acquire_disabled_is_noop(self) -> None:
+        """Test that a fully disabled throttler hands out a shared no-op context."""
+        throttler = RequestThrottler(max_concurrent=0)
+
+        with throttler.acquire():
+            pass
+
+        assert throttler.acquire() is RequestThrottler._NOOP_CM
+        assert throttler.stats["total_requests"] == 0
+
 
 class TestRequestThrottlerConcurrency:
     """Tests for concurrent request limiting."""
 
-    def test_limits_concurrent_requests(self) -> None:
+    def test_limits_concurrent_requests(self, pool: ThreadPoolExecutor) -> None:
         """Test that concurrent requests are limited."""
         max_concurrent = 3
         throttler = RequestThrottler(max_concurrent=max_concurrent)
         concurrent_count = []
         lock = threading.Lock()
+        entered = threading.Semaphore(0)
+        release = threading.Event()
 
         def worker() -> None:
             with throttler.acquire():
                 with lock:
                     concurrent_count.append(throttler.stats["current_concurrent"])
-                time.sleep(0.05)  # Hold the slot briefly
-
-        # Start more threads than max_concurrent
-        threads = [threading.Thread(target=worker) for _ in range(10)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+                entered.release()
+                release.wait(timeout=5.0)  # Hold the slot until released
+
+        # Start more workers than max_concurrent
+        futures = [pool.submit(worker) for _ in range(10)]
+
+        # Once every slot is held, nobody else gets in until slots are released
+        try:
+            for _ in range(max_concurrent):
+                assert entered.acquire(timeout=5.0)
+            assert throttler.stats["current_concurrent"] == max_concurrent
+        finally:
+            # Never leave workers holding the shared pool, even on failure
+            release.set()
+        for future in as_completed(futures):
+            future.result()
 
         # No recorded count should exceed max_concurrent
+        assert len(concurrent_count) == 10
         assert all(c <= max_concurrent for c in concurrent_count)
 
-    def test_concurrent_requests_complete(self) -> None:
+    def test_concurrent_requests_complete(self, pool: ThreadPoolExecutor) -> None:
         """Test that all concurrent requests eventually complete."""
         throttler = RequestThrottler(max_concurrent=2)
         results = []
@@ -103,14 +156,12 @@ class TestRequestThrottlerConcurrency:
 
         def worker(n: int) -> int:
             with throttler.acquire():
-                time.sleep(0.01)
                 with lock:
                     results.append(n)
                 return n
 
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(worker, i) for i in range(10)]
-            completed = [f.result() for f in as_completed(futures)]
+        futures = [pool.submit(worker, i) for i in range(10)]
+        completed = [f.result() for f in as_completed(futures)]
 
         assert len(completed) == 10
         assert len(results) == 10
@@ -119,26 +170,23 @@ class TestRequestThrottlerConcurrency:
 class TestRequestThrottlerRateLimiting:
     """Tests for rate limiting functionality."""
 
-    def test_rate_limiting_enforced(self) -> None:
+    def test_rate_limiting_enforced(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that rate limiting is enforced."""
         # 5 requests per second = 0.2s between requests
         # With max_concurrent=2, bucket starts with 2 tokens
         throttler = RequestThrottler(max_concurrent=2, requests_per_second=5.0)
-
-        start = time.monotonic()
+        clock = FakeClock(time.monotonic())
+        monkeypatch.setattr(throttler, "_time", clock)
+        monkeypatch.setattr(throttler, "_sleep", clock.sleep)
 
         # Make 5 requests:
         # - First 2 use initial tokens (instant)
-        # - Next 3 need to wait for tokens at 5/sec rate = 0.6s minimum
+        # - Next 3 each wait 0.2s for a token to refill
         for _ in range(5):
             with throttler.acquire():
                 pass
 
-        elapsed = time.monotonic() - start
-
-        # We need at least 0.6s for the 3 rate-limited requests
-        # Allow some tolerance for execution overhead
-        assert elapsed >= 0.5, f"Rate limiting not enforced, elapsed: {elapsed}"
+        assert clock.sleeps == pytest.approx([0.2, 0.2, 0.2])
 
     def test_no_rate_limiting_when_disabled(self) -> None:
         """Test that requests are fast when rate limiting is disabled."""
@@ -161,24 +209,18 @@ class TestRequestThrottlerWithOrtexClient:
 
     def test_client_has_throttler(self, api_key: str) -> None:
         """Test that OrtexClient has a throttler."""
-        from ortex import OrtexClient
-
         client = OrtexClient(api_key=api_key)
         assert client.throttler is not None
         assert isinstance(client.throttler, RequestThrottler)
 
     def test_client_default_throttler_settings(self, api_key: str) -> None:
         """Test default throttler settings in OrtexClient."""
-        from ortex import OrtexClient
-
         client = OrtexClient(api_key=api_key)
         assert client.throttler.max_concurrent == 2  # OrtexClient default
         assert client.throttler.requests_per_second == 3.0  # OrtexClient default
 
     def test_client_custom_throttler_settings(self, api_key: str) -> None:
         """Test custom throttler settings in OrtexClient."""
-        from ortex import OrtexClient
-
         client = OrtexClient(
             api_key=api_key,
             max_concurrent_requests=5,
@@ -189,8 +231,6 @@ class TestRequestThrottlerWithOrtexClient:
 
     def test_client_disabled_throttling(self, api_key: str) -> None:
         """Test disabling throttling in OrtexClient."""
-        from ortex import OrtexClient
-
         client = OrtexClient(api_key=api_key, max_concurrent_requests=0)
         assert client.throttler.max_concurrent == 0
 
@@ -202,23 +242,13 @@ class TestRequestThrottlerTimeout:
         """Test that acquire can timeout."""
         throttler = RequestThrottler(max_concurrent=1)
 
-        # Acquire the only slot
+        # Acquire the only slot, then try again without waiting
         with throttler.acquire():
-            # Try to acquire from another thread with short timeout
-            result = {"timed_out": False}
-
-            def try_acquire() -> None:
-                try:
-                    with throttler.acquire(timeout=0.1):
-                        pass
-                except TimeoutError:
-                    result["timed_out"] = True
-
-            thread = threading.Thread(target=try_acquire)
-            thread.start()
-            thread.join()
+            with pytest.raises(TimeoutError):
+                with throttler.acquire(timeout=0):
+                    pass
 
-            assert result["timed_out"], "Expected timeout but didn't get one"
+        assert throttler.stats["queued_requests"] == 0
 
 
 class TestRequestThrottlerStats:
@@ -232,19 +262,18 @@ class TestRequestThrottlerStats:
         assert stats["queued_requests"] == 0
         assert stats["current_concurrent"] == 0
 
-    def test_stats_thread_safe(self) -> None:
+    def test_stats_thread_safe(self, pool: ThreadPoolExecutor) -> None:
         """Test that statistics are thread-safe."""
         throttler = RequestThrottler(max_concurrent=5)
+        # Every batch of slot holders waits for the others, so all slots are busy
+        barrier = threading.Barrier(5, timeout=5.0)
 
         def worker() -> None:
             with throttler.acquire():
-                time.sleep(0.01)
+                barrier.wait()
 
-        threads = [threading.Thread(target=worker) for _ in range(20)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        for future in as_completed([pool.submit(worker) for _ in range(20)]):
+            future.result()
 
         stats = throttler.stats
         assert stats["total_requests"] == 20